@@ -193,7 +193,7 @@ def _check_relation_event(
             "Please pass one.",
         )
     else:
-        if not event.name.startswith(_normalise_name(event.relation.endpoint)):
+        if not event.name.startswith(event.relation._normalised_endpoint):
             errors.append(
                 f"relation event should start with relation endpoint name. {event.name} does "
                 f"not start with {event.relation.endpoint}.",
@@ -383,10 +383,13 @@ def check_storages_consistency(
     return Results(errors, [])
 
 
+# cf. https://github.com/juju/juju/blob/13eb9df3df16a84fd471af8a3c95ddbd04389b71/core/secrets/secret.go#L48
+_SECRET_ID_RE = re.compile(r"secret:[0-9a-z]{20}$")
+
+
 def _is_secret_identifier(value: Union[str, int, float, bool]) -> bool:
     """Return true iff the value is in the form `secret:{secret id}`."""
-    # cf. https://github.com/juju/juju/blob/13eb9df3df16a84fd471af8a3c95ddbd04389b71/core/secrets/secret.go#L48
-    return bool(re.match(r"secret:[0-9a-z]{20}$", str(value)))
+    return bool(_SECRET_ID_RE.match(str(value)))
 
 
 def check_config_consistency(
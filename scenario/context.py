@@ -6,7 +6,18 @@ import functools
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import ops
 
@@ -509,7 +520,9 @@ class Context:
         self._app_name = app_name
         self._unit_id = unit_id
         self.app_trusted = app_trusted
-        self._tmp = tempfile.TemporaryDirectory()
+        # simulated filesystem roots, by container name and by storage (name, index)
+        self._container_roots: Dict[str, Path] = {}
+        self._storage_roots: Dict[Tuple[str, int], Path] = {}
 
         # config for what events to be captured in emitted_events.
         self.capture_deferred_events = capture_deferred_events
@@ -539,14 +552,33 @@ class Context:
         """Hook for Runtime to set the output state."""
         self._output_state = output_state
 
+    @functools.cached_property
+    def _tmp(self) -> tempfile.TemporaryDirectory:
+        """Tempdir holding the simulated container and storage filesystems.
+
+        Created on first use: most runs never touch either filesystem.
+        """
+        return tempfile.TemporaryDirectory()
+
     def _get_container_root(self, container_name: str):
         """Get the path to a tempdir where this container's simulated root will live."""
-        return Path(self._tmp.name) / "containers" / container_name
+        try:
+            return self._container_roots[container_name]
+        except KeyError:
+            pass
+        container_root = Path(self._tmp.name) / "containers" / container_name
+        self._container_roots[container_name] = container_root
+        return container_root
 
     def _get_storage_root(self, name: str, index: int) -> Path:
         """Get the path to a tempdir where this storage's simulated root will live."""
-        storage_root = Path(self._tmp.name) / "storages" / f"{name}-{index}"
+        try:
+            storage_root = self._storage_roots[(name, index)]
+        except KeyError:
+            storage_root = Path(self._tmp.name) / "storages" / f"{name}-{index}"
+            self._storage_roots[(name, index)] = storage_root
         # in the case of _get_container_root, _MockPebbleClient will ensure the dir exists.
+        # Checked on every call, as the directory may have been removed since.
         storage_root.mkdir(parents=True, exist_ok=True)
         return storage_root
 
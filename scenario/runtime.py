@@ -35,6 +35,7 @@ from scenario.state import (
     Relation,
     StoredState,
     SubordinateRelation,
+    _SafeDumper,
 )
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -361,9 +362,9 @@ class Runtime:
                 "To avoid this, clean any metadata files from the charm_root before calling run.",
             )
 
-        metadata_yaml.write_text(yaml.safe_dump(spec.meta))
-        config_yaml.write_text(yaml.safe_dump(spec.config or {}))
-        actions_yaml.write_text(yaml.safe_dump(spec.actions or {}))
+        metadata_yaml.write_text(yaml.dump(spec.meta, Dumper=_SafeDumper))
+        config_yaml.write_text(yaml.dump(spec.config or {}, Dumper=_SafeDumper))
+        actions_yaml.write_text(yaml.dump(spec.actions or {}, Dumper=_SafeDumper))
 
         yield virtual_charm_root
 
@@ -4,14 +4,15 @@
 
 """The core Scenario State object, and the components inside it."""
 
+import copy
 import dataclasses
 import datetime
+import functools
 import inspect
+import os
 import random
-import re
 import string
 from enum import Enum
-from itertools import chain
 from pathlib import Path, PurePosixPath
 from typing import (
     TYPE_CHECKING,
@@ -58,6 +59,15 @@ UnitID = int
 
 CharmType = TypeVar("CharmType", bound=CharmBase)
 
+# The dumper is used by the runtime to write out the charm metadata.
+try:
+    from yaml import CSafeDumper as _SafeDumper  # noqa: F401
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    # PyYAML was built without libyaml.
+    from yaml import SafeDumper as _SafeDumper  # type: ignore  # noqa: F401
+    from yaml import SafeLoader as _SafeLoader  # type: ignore
+
 logger = scenario_logger.getChild("state")
 
 ATTACH_ALL_STORAGES = "ATTACH_ALL_STORAGES"
@@ -67,51 +77,61 @@ DETACH_ALL_STORAGES = "DETACH_ALL_STORAGES"
 
 _ACTION_EVENT_SUFFIX = "_action"
 # all builtin events except secret events. They're special because they carry secret metadata.
-_BUILTIN_EVENTS = {
-    "start",
-    "stop",
-    "install",
-    "install",
-    "start",
-    "stop",
-    "remove",
-    "update_status",
-    "config_changed",
-    "upgrade_charm",
-    "pre_series_upgrade",
-    "post_series_upgrade",
-    "leader_elected",
-    "leader_settings_changed",
-    "collect_metrics",
-}
-_FRAMEWORK_EVENTS = {
-    "pre_commit",
-    "commit",
-    "collect_app_status",
-    "collect_unit_status",
-}
+_BUILTIN_EVENTS = frozenset(
+    {
+        "install",
+        "start",
+        "stop",
+        "remove",
+        "update_status",
+        "config_changed",
+        "upgrade_charm",
+        "pre_series_upgrade",
+        "post_series_upgrade",
+        "leader_elected",
+        "leader_settings_changed",
+        "collect_metrics",
+    },
+)
+_FRAMEWORK_EVENTS = frozenset(
+    {
+        "pre_commit",
+        "commit",
+        "collect_app_status",
+        "collect_unit_status",
+    },
+)
 _PEBBLE_READY_EVENT_SUFFIX = "_pebble_ready"
 _PEBBLE_CUSTOM_NOTICE_EVENT_SUFFIX = "_pebble_custom_notice"
 _PEBBLE_CHECK_FAILED_EVENT_SUFFIX = "_pebble_check_failed"
 _PEBBLE_CHECK_RECOVERED_EVENT_SUFFIX = "_pebble_check_recovered"
-_RELATION_EVENTS_SUFFIX = {
-    "_relation_changed",
-    "_relation_broken",
-    "_relation_joined",
-    "_relation_departed",
-    "_relation_created",
-}
-_STORAGE_EVENTS_SUFFIX = {
-    "_storage_detaching",
-    "_storage_attached",
-}
-
-_SECRET_EVENTS = {
-    "secret_changed",
-    "secret_remove",
-    "secret_rotate",
-    "secret_expired",
-}
+_RELATION_EVENTS_SUFFIX = frozenset(
+    {
+        "_relation_changed",
+        "_relation_broken",
+        "_relation_joined",
+        "_relation_departed",
+        "_relation_created",
+    },
+)
+_STORAGE_EVENTS_SUFFIX = frozenset(
+    {
+        "_storage_detaching",
+        "_storage_attached",
+    },
+)
+# str.endswith() only takes tuples, so keep those around for the suffix checks.
+_RELATION_EVENTS_SUFFIXES = tuple(sorted(_RELATION_EVENTS_SUFFIX))
+_STORAGE_EVENTS_SUFFIXES = tuple(sorted(_STORAGE_EVENTS_SUFFIX))
+
+_SECRET_EVENTS = frozenset(
+    {
+        "secret_changed",
+        "secret_remove",
+        "secret_rotate",
+        "secret_expired",
+    },
+)
 
 
 class ActionFailed(Exception):
@@ -187,7 +207,11 @@ def _max_posargs(n: int):
             # The default __reduce__ doesn't understand that some arguments have
             # to be passed as keywords, so using the copy module fails.
             attrs = cast(Dict[str, Any], super().__reduce__()[2])
-            return (lambda: self.__class__(**attrs), ())
+            # Cached properties also live in the instance __dict__, but they are
+            # not __init__ arguments; the copy will recompute them on demand.
+            fields = dataclasses.fields(self)  # type: ignore
+            init_attrs = {field.name: attrs[field.name] for field in fields}
+            return (lambda: self.__class__(**init_attrs), ())
 
     return _MaxPositionalArgs
 
@@ -276,12 +300,13 @@ class CloudSpec(_max_posargs(1)):
         )
 
 
+_SECRET_ID_ALPHABET = string.ascii_lowercase + string.digits
+
+
 def _generate_secret_id():
     # This doesn't account for collisions, but the odds are so low that it
     # should not be possible in any realistic test run.
-    secret_id = "".join(
-        random.choice(string.ascii_lowercase + string.digits) for _ in range(20)
-    )
+    secret_id = "".join(random.choices(_SECRET_ID_ALPHABET, k=20))
     return f"secret:{secret_id}"
 
 
@@ -366,23 +391,24 @@ class Secret(_max_posargs(1)):
         rotate: Optional[SecretRotate] = None,
     ):
         """Update the metadata."""
-        # bypass frozen dataclass
-        object.__setattr__(self, "_latest_revision", self._latest_revision + 1)
+        updates: Dict[str, Any] = {"_latest_revision": self._latest_revision + 1}
         # TODO: if this is done twice in the same hook, then Juju ignores the
         # first call, it doesn't continue to update like this does.
         # Fix when https://github.com/canonical/operator/issues/1288 is resolved.
         if content:
-            object.__setattr__(self, "latest_content", content)
+            updates["latest_content"] = content
         if label:
-            object.__setattr__(self, "label", label)
+            updates["label"] = label
         if description:
-            object.__setattr__(self, "description", description)
+            updates["description"] = description
         if expire:
             if isinstance(expire, datetime.timedelta):
                 expire = datetime.datetime.now() + expire
-            object.__setattr__(self, "expire", expire)
+            updates["expire"] = expire
         if rotate:
-            object.__setattr__(self, "rotate", rotate)
+            updates["rotate"] = rotate
+        # bypass frozen dataclass, setting all the fields in one go
+        self.__dict__.update(updates)
 
 
 def _normalise_name(s: str):
@@ -410,6 +436,10 @@ class Address(_max_posargs(1)):
     def address(self, value):
         object.__setattr__(self, "value", value)
 
+    def _hook_tool_output_fmt(self):
+        # dumps itself to dict in the same format the hook tool would
+        return {"value": self.value, "hostname": self.hostname, "cidr": self.cidr}
+
 
 @dataclasses.dataclass(frozen=True)
 class BindAddress(_max_posargs(1)):
@@ -427,7 +457,7 @@ class BindAddress(_max_posargs(1)):
         # todo support for legacy (deprecated) `interfacename` and `macaddress` fields?
         dct = {
             "interface-name": self.interface_name,
-            "addresses": [dataclasses.asdict(addr) for addr in self.addresses],
+            "addresses": [addr._hook_tool_output_fmt() for addr in self.addresses],
         }
         if self.mac_address:
             dct["mac-address"] = self.mac_address
@@ -512,11 +542,15 @@ class RelationBase(_max_posargs(2)):
         """
         raise AttributeError("use .id instead of .relation_id")
 
+    @functools.cached_property
+    def _normalised_endpoint(self) -> str:
+        """The endpoint name as used in event names."""
+        return _normalise_name(self.endpoint)
+
     @property
-    def _databags(self):
-        """Yield all databags in this relation."""
-        yield self.local_app_data
-        yield self.local_unit_data
+    def _databags(self) -> Tuple["RawDataBagContents", ...]:
+        """All databags in this relation."""
+        return (self.local_app_data, self.local_unit_data)
 
     @property
     def _remote_unit_ids(self) -> Tuple["UnitID", ...]:
@@ -536,7 +570,6 @@ class RelationBase(_max_posargs(2)):
                 "RelationBase cannot be instantiated directly; "
                 "please use Relation, PeerRelation, or SubordinateRelation",
             )
-
         for databag in self._databags:
             self._validate_databag(databag)
 
@@ -600,12 +633,14 @@ class Relation(RelationBase):
         return self.remote_units_data[unit_id]
 
     @property
-    def _databags(self):
-        """Yield all databags in this relation."""
-        yield self.local_app_data
-        yield self.local_unit_data
-        yield self.remote_app_data
-        yield from self.remote_units_data.values()
+    def _databags(self) -> Tuple["RawDataBagContents", ...]:
+        """All databags in this relation."""
+        return (
+            self.local_app_data,
+            self.local_unit_data,
+            self.remote_app_data,
+            *self.remote_units_data.values(),
+        )
 
 
 @dataclasses.dataclass(frozen=True)
@@ -642,12 +677,14 @@ class SubordinateRelation(RelationBase):
         return self.remote_unit_data
 
     @property
-    def _databags(self):
-        """Yield all databags in this relation."""
-        yield self.local_app_data
-        yield self.local_unit_data
-        yield self.remote_app_data
-        yield self.remote_unit_data
+    def _databags(self) -> Tuple["RawDataBagContents", ...]:
+        """All databags in this relation."""
+        return (
+            self.local_app_data,
+            self.local_unit_data,
+            self.remote_app_data,
+            self.remote_unit_data,
+        )
 
     @property
     def remote_unit_name(self) -> str:
@@ -669,11 +706,9 @@ class PeerRelation(RelationBase):
         return hash(self.id)
 
     @property
-    def _databags(self):
-        """Yield all databags in this relation."""
-        yield self.local_app_data
-        yield self.local_unit_data
-        yield from self.peers_data.values()
+    def _databags(self) -> Tuple["RawDataBagContents", ...]:
+        """All databags in this relation."""
+        return (self.local_app_data, self.local_unit_data, *self.peers_data.values())
 
     @property
     def _remote_unit_ids(self) -> Tuple["UnitID", ...]:
@@ -685,12 +720,11 @@ class PeerRelation(RelationBase):
         return self.peers_data[unit_id]
 
 
-def _random_model_name():
-    import random
-    import string
+_MODEL_NAME_ALPHABET = string.ascii_letters + string.digits
+
 
-    space = string.ascii_letters + string.digits
-    return "".join(random.choice(space) for _ in range(20))
+def _random_model_name():
+    return "".join(random.choices(_MODEL_NAME_ALPHABET, k=20))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -721,9 +755,10 @@ _CHANGE_IDS = 0
 def _generate_new_change_id():
     global _CHANGE_IDS
     _CHANGE_IDS += 1
-    logger.info(
-        f"change ID unset; automatically assigning {_CHANGE_IDS}. "
-        f"If there are problems, pass one manually.",
+    logger.debug(
+        "change ID unset; automatically assigning %s. "
+        "If there are problems, pass one manually.",
+        _CHANGE_IDS,
     )
     return _CHANGE_IDS
 
@@ -1005,7 +1040,9 @@ class Container(_max_posargs(1)):
         """
 
         # copied over from ops.testing._TestingPebbleClient.get_plan().
-        plan = pebble.Plan(yaml.safe_dump(self._base_plan))
+        # Plan accepts the dict form directly (and copies what it needs out of
+        # it), so there is no need to round-trip the base plan through YAML.
+        plan = pebble.Plan(self._base_plan)  # type: ignore
         services = self._render_services()
         if not services:
             return plan
@@ -1090,7 +1127,7 @@ class _EntityStatus:
     ) -> "_EntityStatus":
         # Note that this won't work for UnknownStatus.
         # All subclasses have a default 'name' attribute, but the type checker can't tell that.
-        return cls._entity_statuses[name](message=message)  # type:ignore
+        return cls._entity_statuses[name](message=message)  # type: ignore
 
     @classmethod
     def from_ops(cls, obj: StatusBase) -> "_EntityStatus":
@@ -1430,17 +1467,21 @@ class State(_max_posargs(0)):
             else:
                 raise TypeError(f"Invalid status.{name}: {val!r}")
         normalised_ports = [
-            Port(protocol=port.protocol, port=port.port)
-            if isinstance(port, ops.Port)
-            else port
+            (
+                Port(protocol=port.protocol, port=port.port)
+                if isinstance(port, ops.Port)
+                else port
+            )
             for port in self.opened_ports
         ]
         if self.opened_ports != normalised_ports:
             object.__setattr__(self, "opened_ports", normalised_ports)
         normalised_storage = [
-            Storage(name=storage.name, index=storage.index)
-            if isinstance(storage, ops.Storage)
-            else storage
+            (
+                Storage(name=storage.name, index=storage.index)
+                if isinstance(storage, ops.Storage)
+                else storage
+            )
             for storage in self.storages
         ]
         if self.storages != normalised_storage:
@@ -1497,12 +1538,33 @@ class State(_max_posargs(0)):
         # bypass frozen dataclass
         object.__setattr__(self, "secrets", new_secrets)
 
+    # Lookup tables for the get_* methods, built on first use. The collections
+    # they index are never replaced after construction, so they can't go stale.
+    @functools.cached_property
+    def _relations_by_endpoint(self) -> Dict[str, Tuple["RelationBase", ...]]:
+        relations: Dict[str, List["RelationBase"]] = {}
+        for relation in self.relations:
+            relations.setdefault(relation._normalised_endpoint, []).append(relation)
+        return {endpoint: tuple(rels) for endpoint, rels in relations.items()}
+
+    @functools.cached_property
+    def _relations_by_id(self) -> Dict[int, "RelationBase"]:
+        return {relation.id: relation for relation in self.relations}
+
+    @functools.cached_property
+    def _containers_by_name(self) -> Dict[str, Container]:
+        return {container.name: container for container in self.containers}
+
+    @functools.cached_property
+    def _storages_by_key(self) -> Dict[Tuple[str, int], Storage]:
+        return {(storage.name, storage.index): storage for storage in self.storages}
+
     def get_container(self, container: str, /) -> Container:
         """Get container from this State, based on its name."""
-        for state_container in self.containers:
-            if state_container.name == container:
-                return state_container
-        raise KeyError(f"container: {container} not found in the State")
+        try:
+            return self._containers_by_name[container]
+        except KeyError:
+            raise KeyError(f"container: {container} not found in the State") from None
 
     def get_network(self, binding_name: str, /) -> Network:
         """Get network from this State, based on its binding name."""
@@ -1551,19 +1613,19 @@ class State(_max_posargs(0)):
         index: Optional[int] = 0,
     ) -> Storage:
         """Get storage from this State, based on the storage's name and index."""
-        for state_storage in self.storages:
-            if state_storage.name == storage and storage.index == index:
-                return state_storage
-        raise ValueError(
-            f"storage: name={storage}, index={index} not found in the State",
-        )
+        try:
+            return self._storages_by_key[(storage, index)]  # type: ignore
+        except KeyError:
+            raise ValueError(
+                f"storage: name={storage}, index={index} not found in the State",
+            ) from None
 
     def get_relation(self, relation: int, /) -> "RelationBase":
         """Get relation from this State, based on the relation's id."""
-        for state_relation in self.relations:
-            if state_relation.id == relation:
-                return state_relation
-        raise KeyError(f"relation: id={relation} not found in the State")
+        try:
+            return self._relations_by_id[relation]
+        except KeyError:
+            raise KeyError(f"relation: id={relation} not found in the State") from None
 
     def get_relations(self, endpoint: str) -> Tuple["RelationBase", ...]:
         """Get all relations on this endpoint from the current state."""
@@ -1573,12 +1635,12 @@ class State(_max_posargs(0)):
         #   foo-bar: ...
         #   foo_bar: ...
 
-        normalized_endpoint = _normalise_name(endpoint)
-        return tuple(
-            r
-            for r in self.relations
-            if _normalise_name(r.endpoint) == normalized_endpoint
-        )
+        return self._relations_by_endpoint.get(_normalise_name(endpoint), ())
+
+
+def _load_yaml(path: Path) -> Any:
+    """Safely load a YAML file, using libyaml if it is available."""
+    return yaml.load(path.read_bytes(), Loader=_SafeLoader)
 
 
 def _is_valid_charmcraft_25_metadata(meta: Dict[str, Any]):
@@ -1613,21 +1675,26 @@ class _CharmSpec(Generic[CharmType]):
         """Load metadata from charm projects created with Charmcraft < 2.5."""
         # back in the days, we used to have separate metadata.yaml, config.yaml and actions.yaml
         # files for charm metadata.
-        metadata_path = charm_root / "metadata.yaml"
-        meta = yaml.safe_load(metadata_path.open()) if metadata_path.exists() else {}
-
-        config_path = charm_root / "config.yaml"
-        config = yaml.safe_load(config_path.open()) if config_path.exists() else None
-
-        actions_path = charm_root / "actions.yaml"
-        actions = yaml.safe_load(actions_path.open()) if actions_path.exists() else None
+        # List the directory once instead of checking for each file separately.
+        try:
+            with os.scandir(charm_root) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            present = set()
+
+        def load(name: str, default: Any):
+            return _load_yaml(charm_root / name) if name in present else default
+
+        meta = load("metadata.yaml", {})
+        config = load("config.yaml", None)
+        actions = load("actions.yaml", None)
         return meta, config, actions
 
     @staticmethod
     def _load_metadata(charm_root: Path):
         """Load metadata from charm projects created with Charmcraft >= 2.5."""
         metadata_path = charm_root / "charmcraft.yaml"
-        meta = yaml.safe_load(metadata_path.open()) if metadata_path.exists() else {}
+        meta = _load_yaml(metadata_path) if metadata_path.exists() else {}
         if not _is_valid_charmcraft_25_metadata(meta):
             meta = {}
         config = meta.pop("config", None)
@@ -1635,10 +1702,12 @@ class _CharmSpec(Generic[CharmType]):
         return meta, config, actions
 
     @staticmethod
-    def autoload(charm_type: Type[CharmBase]) -> "_CharmSpec[CharmType]":
-        """Construct a ``_CharmSpec`` object by looking up the metadata from the charm's repo root.
+    @functools.lru_cache(maxsize=128)
+    def _load_charm_type_metadata(charm_type: Type[CharmBase]):
+        """Parse the metadata of the charm repo that ``charm_type`` lives in.
 
-        Will attempt to load the metadata off the ``charmcraft.yaml`` file
+        Cached per charm class: test suites create many Contexts for the same
+        charm, so the YAML files are read and parsed only once.
         """
         charm_source_path = Path(inspect.getfile(charm_type))
         charm_root = charm_source_path.parent.parent
@@ -1658,6 +1727,24 @@ class _CharmSpec(Generic[CharmType]):
                 f"(or a `metadata.yaml` file if it's an old charm).",
             )
 
+        return meta, config, actions
+
+    @staticmethod
+    def autoload(charm_type: Type[CharmBase]) -> "_CharmSpec[CharmType]":
+        """Construct a ``_CharmSpec`` object by looking up the metadata from the charm's repo root.
+
+        Will attempt to load the metadata off the ``charmcraft.yaml`` file
+
+        The parsed metadata is cached per charm class, so edits to the metadata
+        files made after the first call for that class are not picked up. Each
+        call returns a new ``_CharmSpec`` with its own copies of the ``meta``,
+        ``actions`` and ``config`` dicts, so mutating them does not leak into
+        other specs.
+        """
+        meta, config, actions = copy.deepcopy(
+            _CharmSpec._load_charm_type_metadata(charm_type),
+        )
+
         return _CharmSpec(
             charm_type=charm_type,
             meta=meta,
@@ -1666,14 +1753,17 @@ class _CharmSpec(Generic[CharmType]):
             is_autoloaded=True,
         )
 
-    def get_all_relations(self) -> List[Tuple[str, Dict[str, str]]]:
-        """A list of all relation endpoints defined in the metadata."""
-        return list(
-            chain(
-                self.meta.get("requires", {}).items(),
-                self.meta.get("provides", {}).items(),
-                self.meta.get("peers", {}).items(),
-            ),
+    def get_all_relations(self) -> Tuple[Tuple[str, Dict[str, str]], ...]:
+        """All relation endpoints defined in the metadata."""
+        return self._all_relations
+
+    # the metadata doesn't change after the spec is created, so only do this once
+    @functools.cached_property
+    def _all_relations(self) -> Tuple[Tuple[str, Dict[str, str]], ...]:
+        return (
+            *self.meta.get("requires", {}).items(),
+            *self.meta.get("provides", {}).items(),
+            *self.meta.get("peers", {}).items(),
         )
 
 
@@ -1718,21 +1808,39 @@ class _EventType(str, Enum):
     custom = "custom"
 
 
+# Events recognised by their full name rather than by a suffix, and the
+# (suffix, type) they are classified as.
+_EVENT_SUFFIX_AND_TYPE_BY_NAME: Dict[str, Tuple[str, _EventType]] = {
+    **{name: (name, _EventType.secret) for name in _SECRET_EVENTS},
+    **{name: (name, _EventType.framework) for name in _FRAMEWORK_EVENTS},
+    **{name: ("", _EventType.builtin) for name in _BUILTIN_EVENTS},
+}
+
+
+# events defined on the charm itself are owned by `charm.on`
+_DEFAULT_OWNER_PATH = ("on",)
+
+
 class _EventPath(str):
     if TYPE_CHECKING:  # pragma: no cover
         name: str
-        owner_path: List[str]
+        owner_path: Tuple[str, ...]
         suffix: str
         prefix: str
         is_custom: bool
         type: _EventType
 
     def __new__(cls, string):
+        # Parsed paths are never modified, so share one instance per distinct string.
+        return _parse_event_path(string)
+
+    @classmethod
+    def _parse(cls, string: str) -> "_EventPath":
         string = _normalise_name(string)
         instance = super().__new__(cls, string)
 
         instance.name = name = string.split(".")[-1]
-        instance.owner_path = string.split(".")[:-1] or ["on"]
+        instance.owner_path = tuple(string.split(".")[:-1]) or _DEFAULT_OWNER_PATH
 
         instance.suffix, instance.type = suffix, _ = _EventPath._get_suffix_and_type(
             name,
@@ -1747,23 +1855,19 @@ class _EventPath(str):
 
     @staticmethod
     def _get_suffix_and_type(s: str) -> Tuple[str, _EventType]:
-        for suffix in _RELATION_EVENTS_SUFFIX:
-            if s.endswith(suffix):
-                return suffix, _EventType.relation
+        if s.endswith(_RELATION_EVENTS_SUFFIXES):
+            for suffix in _RELATION_EVENTS_SUFFIXES:
+                if s.endswith(suffix):
+                    return suffix, _EventType.relation
 
         if s.endswith(_ACTION_EVENT_SUFFIX):
             return _ACTION_EVENT_SUFFIX, _EventType.action
 
-        if s in _SECRET_EVENTS:
-            return s, _EventType.secret
-
-        if s in _FRAMEWORK_EVENTS:
-            return s, _EventType.framework
-
         # Whether the event name indicates that this is a storage event.
-        for suffix in _STORAGE_EVENTS_SUFFIX:
-            if s.endswith(suffix):
-                return suffix, _EventType.storage
+        if s.endswith(_STORAGE_EVENTS_SUFFIXES):
+            for suffix in _STORAGE_EVENTS_SUFFIXES:
+                if s.endswith(suffix):
+                    return suffix, _EventType.storage
 
         # Whether the event name indicates that this is a workload event.
         if s.endswith(_PEBBLE_READY_EVENT_SUFFIX):
@@ -1775,10 +1879,12 @@ class _EventPath(str):
         if s.endswith(_PEBBLE_CHECK_RECOVERED_EVENT_SUFFIX):
             return _PEBBLE_CHECK_RECOVERED_EVENT_SUFFIX, _EventType.workload
 
-        if s in _BUILTIN_EVENTS:
-            return "", _EventType.builtin
+        # None of the suffixes above is a suffix of any of the full names, so
+        # checking those last gives the same result.
+        return _EVENT_SUFFIX_AND_TYPE_BY_NAME.get(s, ("", _EventType.custom))
 
-        return "", _EventType.custom
+
+_parse_event_path = functools.lru_cache(maxsize=4096)(_EventPath._parse)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -1819,8 +1925,6 @@ class _Event:
     action: Optional["_Action"] = None
     """If this is an action event, the :class:`Action` it refers to."""
 
-    _owner_path: List[str] = dataclasses.field(default_factory=list)
-
     def __post_init__(self):
         path = _EventPath(self.path)
         # bypass frozen dataclass
@@ -1845,10 +1949,10 @@ class _Event:
         return self._path.name
 
     @property
-    def owner_path(self) -> List[str]:
+    def owner_path(self) -> Tuple[str, ...]:
         """Path to the ObjectEvents instance owning this event.
 
-        If this event is defined on the toplevel charm class, it should be ['on'].
+        If this event is defined on the toplevel charm class, it should be ``('on',)``.
         """
         return self._path.owner_path
 
@@ -1884,8 +1988,11 @@ class _Event:
         event_name = self.name
 
         # simple case: this is an event type owned by our charm base.on
-        if hasattr(charm_spec.charm_type.on, event_name):
-            return hasattr(CharmEvents, event_name)
+        # Look the name up in the class dicts directly: going through getattr
+        # would make the EventSource descriptor build a BoundEvent each time.
+        for klass in type(charm_spec.charm_type.on).__mro__:
+            if event_name in vars(klass):
+                return hasattr(CharmEvents, event_name)
 
         # this could be an event defined on some other Object, e.g. a charm lib.
         # We don't support (yet) directly emitting those, but they COULD have names that conflict
@@ -1900,14 +2007,14 @@ class _Event:
 
     def deferred(self, handler: Callable, event_id: int = 1) -> DeferredEvent:
         """Construct a DeferredEvent from this Event."""
-        handler_repr = repr(handler)
-        handler_re = re.compile(r"<function (.*) at .*>")
-        match = handler_re.match(handler_repr)
-        if not match:
+        # For a method, this is "Owner.handler_name" (possibly with more
+        # levels of nesting in front of it).
+        qualname = getattr(handler, "__qualname__", "")
+        if "." not in qualname:
             raise ValueError(
                 f"cannot construct DeferredEvent from {handler}; please create one manually.",
             )
-        owner_name, handler_name = match.groups()[0].split(".")[-2:]
+        owner_name, handler_name = qualname.rsplit(".", 2)[-2:]
         handle_path = f"{owner_name}/on/{self.name}[{event_id}]"
 
         # Many events have no snapshot data: install, start, stop, remove, config-changed,
@@ -1958,13 +2065,13 @@ class _Event:
                 },
             )
             if not self.name.endswith(("_created", "_broken")):
-                snapshot_data[
-                    "unit_name"
-                ] = f"{remote_app}/{self.relation_remote_unit_id}"
+                snapshot_data["unit_name"] = (
+                    f"{remote_app}/{self.relation_remote_unit_id}"
+                )
             if self.name.endswith("_departed"):
-                snapshot_data[
-                    "departing_unit"
-                ] = f"{remote_app}/{self.relation_departed_unit_id}"
+                snapshot_data["departing_unit"] = (
+                    f"{remote_app}/{self.relation_departed_unit_id}"
+                )
 
         elif self._is_storage_event:
             # Enforced by the consistency checker, but for type checkers:
@@ -64,6 +64,9 @@ def trigger(
 
 
 def jsonpatch_delta(self, other: "State"):
+    if self == other:
+        # nothing to diff: skip serialising both states
+        return []
     dict_other = dataclasses.asdict(other)
     dict_self = dataclasses.asdict(self)
     for attr in (
@@ -91,6 +91,12 @@ def test_autoload_legacy_no_meta_fails(tmp_path):
             _CharmSpec.autoload(charm)
 
 
+@pytest.mark.parametrize("root", ("missing", "file"))
+def test_load_metadata_legacy_no_charm_dir(tmp_path, root):
+    (tmp_path / "file").touch()
+    assert _CharmSpec._load_metadata_legacy(tmp_path / root) == ({}, None, None)
+
+
 def test_autoload_legacy_no_type_passes(tmp_path):
     with create_tempcharm(tmp_path, legacy=True, meta={"name": "foo"}) as charm:
         _CharmSpec.autoload(charm)
@@ -104,6 +110,34 @@ def test_autoload_legacy_type_passes(tmp_path, config_type):
         _CharmSpec.autoload(charm)
 
 
+@pytest.mark.parametrize("legacy", (True, False))
+def test_autoload_returns_independent_specs(tmp_path, legacy):
+    with create_tempcharm(
+        tmp_path,
+        legacy=legacy,
+        meta={
+            "type": "charm",
+            "name": "foo",
+            "summary": "foo",
+            "description": "foo",
+            "requires": {"db": {"interface": "sql"}},
+        },
+        actions={"act": {}},
+        config={"options": {"foo": {"type": "string"}}},
+    ) as charm:
+        spec1 = _CharmSpec.autoload(charm)
+        spec1.meta["requires"]["db"]["interface"] = "mutated"
+        spec1.meta["name"] = "mutated"
+        spec1.actions["other"] = {}
+        spec1.config["options"].clear()
+
+        spec2 = _CharmSpec.autoload(charm)
+        assert spec2.meta["name"] == "foo"
+        assert spec2.meta["requires"] == {"db": {"interface": "sql"}}
+        assert spec2.actions == {"act": {}}
+        assert spec2.config == {"options": {"foo": {"type": "string"}}}
+
+
 @pytest.mark.parametrize("legacy", (True, False))
 def test_meta_autoload(tmp_path, legacy):
     with create_tempcharm(
@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
 from ops import CharmBase
@@ -11,37 +11,55 @@ class MyCharm(CharmBase):
     pass
 
 
-def test_run():
-    ctx = Context(MyCharm, meta={"name": "foo"})
+@pytest.fixture(scope="module")
+def ctx():
+    return Context(MyCharm, meta={"name": "foo"}, actions={"act": {}})
+
+
+@pytest.fixture(scope="module")
+def start_event(ctx):
+    return ctx.on.start()
+
+
+@pytest.fixture(scope="module")
+def act_event(ctx):
+    return ctx.on.action("act")
+
+
+@pytest.fixture
+def mocked_run(ctx):
+    ctx._run = MagicMock()
+    yield ctx._run
+    del ctx._run  # fall back to the class's _run
+
+
+def test_run(ctx, mocked_run):
     state = State()
 
-    with patch.object(ctx, "_run") as p:
-        ctx._output_state = "foo"  # would normally be set within the _run call scope
-        output = ctx.run(ctx.on.start(), state)
-        assert output == "foo"
+    ctx._output_state = "foo"  # would normally be set within the _run call scope
+    output = ctx.run(ctx.on.start(), state)
+    assert output == "foo"
 
-    assert p.called
-    e = p.call_args.kwargs["event"]
-    s = p.call_args.kwargs["state"]
+    assert mocked_run.called
+    e = mocked_run.call_args.kwargs["event"]
+    s = mocked_run.call_args.kwargs["state"]
 
     assert isinstance(e, _Event)
     assert e.name == "start"
     assert s is state
 
 
-def test_run_action():
-    ctx = Context(MyCharm, meta={"name": "foo"})
+def test_run_action(ctx, mocked_run):
     state = State()
     expected_id = _next_action_id(update=False)
 
-    with patch.object(ctx, "_run") as p:
-        ctx._output_state = "foo"  # would normally be set within the _run call scope
-        output = ctx.run(ctx.on.action("do-foo"), state)
-        assert output == "foo"
+    ctx._output_state = "foo"  # would normally be set within the _run call scope
+    output = ctx.run(ctx.on.action("do-foo"), state)
+    assert output == "foo"
 
-    assert p.called
-    e = p.call_args.kwargs["event"]
-    s = p.call_args.kwargs["state"]
+    assert mocked_run.called
+    e = mocked_run.call_args.kwargs["event"]
+    s = mocked_run.call_args.kwargs["state"]
 
     assert isinstance(e, _Event)
     assert e.name == "do_foo_action"
@@ -58,13 +76,12 @@ def test_app_name(app_name, unit_id):
         assert mgr.charm.unit.name == f"{app_name}/{unit_id}"
 
 
-def test_context_manager():
-    ctx = Context(MyCharm, meta={"name": "foo"}, actions={"act": {}})
+def test_context_manager(ctx, start_event, act_event):
     state = State()
-    with ctx(ctx.on.start(), state) as mgr:
+    with ctx(start_event, state) as mgr:
         mgr.run()
         assert mgr.charm.meta.name == "foo"
 
-    with ctx(ctx.on.action("act"), state) as mgr:
+    with ctx(act_event, state) as mgr:
         mgr.run()
         assert mgr.charm.meta.name == "foo"
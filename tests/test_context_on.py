@@ -1,5 +1,3 @@
-import copy
-
 import ops
 import pytest
 
@@ -45,6 +43,25 @@ class ContextCharm(ops.CharmBase):
         self.observed.append(event)
 
 
+@pytest.fixture(scope="module")
+def ctx():
+    return scenario.Context(ContextCharm, meta=META, actions=ACTIONS)
+
+
+def _run_and_get(ctx, event, state, event_kind):
+    """Run the event and return the charm's view of it.
+
+    The charm should see exactly that event, followed by collect-status.
+    """
+    with ctx(event, state) as mgr:
+        mgr.run()
+        observed = mgr.charm.observed
+    assert len(observed) == 2
+    assert isinstance(observed[1], ops.CollectStatusEvent)
+    assert isinstance(observed[0], event_kind)
+    return observed[0]
+
+
 @pytest.mark.parametrize(
     "event_name, event_kind",
     [
@@ -59,28 +76,35 @@ class ContextCharm(ops.CharmBase):
         ("post_series_upgrade", ops.PostSeriesUpgradeEvent),
         ("leader_elected", ops.LeaderElectedEvent),
     ],
+    ids=[
+        "install",
+        "start",
+        "stop",
+        "remove",
+        "update_status",
+        "config_changed",
+        "upgrade_charm",
+        "pre_series_upgrade",
+        "post_series_upgrade",
+        "leader_elected",
+    ],
 )
-def test_simple_events(event_name, event_kind):
-    ctx = scenario.Context(ContextCharm, meta=META, actions=ACTIONS)
+def test_simple_events(ctx, event_name, event_kind):
     # These look like:
     #   ctx.run(ctx.on.install(), state)
-    with ctx(getattr(ctx.on, event_name)(), scenario.State()) as mgr:
-        mgr.run()
-        assert len(mgr.charm.observed) == 2
-        assert isinstance(mgr.charm.observed[1], ops.CollectStatusEvent)
-        assert isinstance(mgr.charm.observed[0], event_kind)
+    _run_and_get(ctx, getattr(ctx.on, event_name)(), scenario.State(), event_kind)
 
 
-@pytest.mark.parametrize("as_kwarg", [True, False])
+@pytest.mark.parametrize("as_kwarg", [True, False], ids=["kwarg", "positional"])
 @pytest.mark.parametrize(
     "event_name,event_kind,owner",
     [
         ("secret_changed", ops.SecretChangedEvent, None),
         ("secret_rotate", ops.SecretRotateEvent, "app"),
     ],
+    ids=["secret_changed", "secret_rotate"],
 )
-def test_simple_secret_events(as_kwarg, event_name, event_kind, owner):
-    ctx = scenario.Context(ContextCharm, meta=META, actions=ACTIONS)
+def test_simple_secret_events(ctx, as_kwarg, event_name, event_kind, owner):
     secret = scenario.Secret({"password": "xxxx"}, owner=owner)
     state_in = scenario.State(secrets={secret})
     # These look like:
@@ -93,13 +117,10 @@ def test_simple_secret_events(as_kwarg, event_name, event_kind, owner):
     else:
         args = (secret,)
         kwargs = {}
-    with ctx(getattr(ctx.on, event_name)(*args, **kwargs), state_in) as mgr:
-        mgr.run()
-        assert len(mgr.charm.observed) == 2
-        assert isinstance(mgr.charm.observed[1], ops.CollectStatusEvent)
-        mgr = mgr.charm.observed[0]
-        assert isinstance(mgr, event_kind)
-        assert mgr.secret.id == secret.id
+    evt = _run_and_get(
+        ctx, getattr(ctx.on, event_name)(*args, **kwargs), state_in, event_kind
+    )
+    assert evt.secret.id == secret.id
 
 
 @pytest.mark.parametrize(
@@ -108,9 +129,9 @@ def test_simple_secret_events(as_kwarg, event_name, event_kind, owner):
         ("secret_expired", ops.SecretExpiredEvent),
         ("secret_remove", ops.SecretRemoveEvent),
     ],
+    ids=["secret_expired", "secret_remove"],
 )
-def test_revision_secret_events(event_name, event_kind):
-    ctx = scenario.Context(ContextCharm, meta=META, actions=ACTIONS)
+def test_revision_secret_events(ctx, event_name, event_kind):
     secret = scenario.Secret(
         tracked_content={"password": "yyyy"},
         latest_content={"password": "xxxx"},
@@ -121,19 +142,15 @@ def test_revision_secret_events(event_name, event_kind):
     #   ctx.run(ctx.on.secret_expired(secret=secret, revision=revision), state)
     # The secret and revision must always be passed because the same event name
     # is used for all secrets.
-    with ctx(getattr(ctx.on, event_name)(secret, revision=42), state_in) as mgr:
-        mgr.run()
-        assert len(mgr.charm.observed) == 2
-        assert isinstance(mgr.charm.observed[1], ops.CollectStatusEvent)
-        mgr = mgr.charm.observed[0]
-        assert isinstance(mgr, event_kind)
-        assert mgr.secret.id == secret.id
-        assert mgr.revision == 42
+    evt = _run_and_get(
+        ctx, getattr(ctx.on, event_name)(secret, revision=42), state_in, event_kind
+    )
+    assert evt.secret.id == secret.id
+    assert evt.revision == 42
 
 
 @pytest.mark.parametrize("event_name", ["secret_expired", "secret_remove"])
-def test_revision_secret_events_as_positional_arg(event_name):
-    ctx = scenario.Context(ContextCharm, meta=META, actions=ACTIONS)
+def test_revision_secret_events_as_positional_arg(ctx, event_name):
     secret = scenario.Secret(
         tracked_content={"password": "yyyy"},
         latest_content={"password": "xxxx"},
@@ -150,76 +167,55 @@ def test_revision_secret_events_as_positional_arg(event_name):
         ("storage_attached", ops.StorageAttachedEvent),
         ("storage_detaching", ops.StorageDetachingEvent),
     ],
+    ids=["storage_attached", "storage_detaching"],
 )
-def test_storage_events(event_name, event_kind):
-    ctx = scenario.Context(ContextCharm, meta=META, actions=ACTIONS)
+def test_storage_events(ctx, event_name, event_kind):
     storage = scenario.Storage("foo")
     state_in = scenario.State(storages=[storage])
     # These look like:
     #   ctx.run(ctx.on.storage_attached(storage), state)
-    with ctx(getattr(ctx.on, event_name)(storage), state_in) as mgr:
-        mgr.run()
-        assert len(mgr.charm.observed) == 2
-        assert isinstance(mgr.charm.observed[1], ops.CollectStatusEvent)
-        mgr = mgr.charm.observed[0]
-        assert isinstance(mgr, event_kind)
-        assert mgr.storage.name == storage.name
-        assert mgr.storage.index == storage.index
+    evt = _run_and_get(ctx, getattr(ctx.on, event_name)(storage), state_in, event_kind)
+    assert evt.storage.name == storage.name
+    assert evt.storage.index == storage.index
 
 
-def test_action_event_no_params():
-    ctx = scenario.Context(ContextCharm, meta=META, actions=ACTIONS)
+def test_action_event_no_params(ctx):
     # These look like:
     #   ctx.run(ctx.on.action(action_name), state)
-    with ctx(ctx.on.action("act"), scenario.State()) as mgr:
-        mgr.run()
-        assert len(mgr.charm.observed) == 2
-        assert isinstance(mgr.charm.observed[1], ops.CollectStatusEvent)
-        mgr = mgr.charm.observed[0]
-        assert isinstance(mgr, ops.ActionEvent)
+    _run_and_get(ctx, ctx.on.action("act"), scenario.State(), ops.ActionEvent)
 
 
-def test_action_event_with_params():
-    ctx = scenario.Context(ContextCharm, meta=META, actions=ACTIONS)
+def test_action_event_with_params(ctx):
     # These look like:
     #   ctx.run(ctx.on.action(action=action), state)
     # So that any parameters can be included and the ID can be customised.
     call_event = ctx.on.action("act", params={"param": "hello"})
-    with ctx(call_event, scenario.State()) as mgr:
-        mgr.run()
-        assert len(mgr.charm.observed) == 2
-        assert isinstance(mgr.charm.observed[1], ops.CollectStatusEvent)
-        mgr = mgr.charm.observed[0]
-        assert isinstance(mgr, ops.ActionEvent)
-        assert mgr.id == call_event.action.id
-        assert mgr.params["param"] == call_event.action.params["param"]
+    evt = _run_and_get(ctx, call_event, scenario.State(), ops.ActionEvent)
+    assert evt.id == call_event.action.id
+    assert evt.params["param"] == call_event.action.params["param"]
 
 
-def test_pebble_ready_event():
-    ctx = scenario.Context(ContextCharm, meta=META, actions=ACTIONS)
+def test_pebble_ready_event(ctx):
     container = scenario.Container("bar", can_connect=True)
     state_in = scenario.State(containers=[container])
     # These look like:
     #   ctx.run(ctx.on.pebble_ready(container), state)
-    with ctx(ctx.on.pebble_ready(container), state_in) as mgr:
-        mgr.run()
-        assert len(mgr.charm.observed) == 2
-        assert isinstance(mgr.charm.observed[1], ops.CollectStatusEvent)
-        mgr = mgr.charm.observed[0]
-        assert isinstance(mgr, ops.PebbleReadyEvent)
-        assert mgr.workload.name == container.name
+    evt = _run_and_get(
+        ctx, ctx.on.pebble_ready(container), state_in, ops.PebbleReadyEvent
+    )
+    assert evt.workload.name == container.name
 
 
-@pytest.mark.parametrize("as_kwarg", [True, False])
+@pytest.mark.parametrize("as_kwarg", [True, False], ids=["kwarg", "positional"])
 @pytest.mark.parametrize(
     "event_name, event_kind",
     [
         ("relation_created", ops.RelationCreatedEvent),
         ("relation_broken", ops.RelationBrokenEvent),
     ],
+    ids=["relation_created", "relation_broken"],
 )
-def test_relation_app_events(as_kwarg, event_name, event_kind):
-    ctx = scenario.Context(ContextCharm, meta=META, actions=ACTIONS)
+def test_relation_app_events(ctx, as_kwarg, event_name, event_kind):
     relation = scenario.Relation("baz")
     state_in = scenario.State(relations=[relation])
     # These look like:
@@ -230,36 +226,32 @@ def test_relation_app_events(as_kwarg, event_name, event_kind):
     else:
         args = (relation,)
         kwargs = {}
-    with ctx(getattr(ctx.on, event_name)(*args, **kwargs), state_in) as mgr:
-        mgr.run()
-        assert len(mgr.charm.observed) == 2
-        assert isinstance(mgr.charm.observed[1], ops.CollectStatusEvent)
-        mgr = mgr.charm.observed[0]
-        assert isinstance(mgr, event_kind)
-        assert mgr.relation.id == relation.id
-        assert mgr.app.name == relation.remote_app_name
-        assert mgr.unit is None
+    evt = _run_and_get(
+        ctx, getattr(ctx.on, event_name)(*args, **kwargs), state_in, event_kind
+    )
+    assert evt.relation.id == relation.id
+    assert evt.app.name == relation.remote_app_name
+    assert evt.unit is None
 
 
 def test_relation_complex_name():
-    meta = copy.deepcopy(META)
-    meta["requires"]["foo-bar-baz"] = {"interface": "another-one"}
+    meta = {
+        **META,
+        "requires": {**META["requires"], "foo-bar-baz": {"interface": "another-one"}},
+    }
     ctx = scenario.Context(ContextCharm, meta=meta, actions=ACTIONS)
     relation = scenario.Relation("foo-bar-baz")
     state_in = scenario.State(relations=[relation])
-    with ctx(ctx.on.relation_created(relation), state_in) as mgr:
-        mgr.run()
-        assert len(mgr.charm.observed) == 2
-        mgr = mgr.charm.observed[0]
-        assert isinstance(mgr, ops.RelationCreatedEvent)
-        assert mgr.relation.id == relation.id
-        assert mgr.app.name == relation.remote_app_name
-        assert mgr.unit is None
+    evt = _run_and_get(
+        ctx, ctx.on.relation_created(relation), state_in, ops.RelationCreatedEvent
+    )
+    assert evt.relation.id == relation.id
+    assert evt.app.name == relation.remote_app_name
+    assert evt.unit is None
 
 
 @pytest.mark.parametrize("event_name", ["relation_created", "relation_broken"])
-def test_relation_events_as_positional_arg(event_name):
-    ctx = scenario.Context(ContextCharm, meta=META, actions=ACTIONS)
+def test_relation_events_as_positional_arg(ctx, event_name):
     relation = scenario.Relation("baz")
     state_in = scenario.State(relations=[relation])
     with pytest.raises(TypeError):
@@ -272,23 +264,18 @@ def test_relation_events_as_positional_arg(event_name):
         ("relation_joined", ops.RelationJoinedEvent),
         ("relation_changed", ops.RelationChangedEvent),
     ],
+    ids=["relation_joined", "relation_changed"],
 )
-def test_relation_unit_events_default_unit(event_name, event_kind):
-    ctx = scenario.Context(ContextCharm, meta=META, actions=ACTIONS)
+def test_relation_unit_events_default_unit(ctx, event_name, event_kind):
     relation = scenario.Relation("baz", remote_units_data={1: {"x": "y"}})
     state_in = scenario.State(relations=[relation])
     # These look like:
     #   ctx.run(ctx.on.baz_relation_changed, state)
     # The unit is chosen automatically.
-    with ctx(getattr(ctx.on, event_name)(relation), state_in) as mgr:
-        mgr.run()
-        assert len(mgr.charm.observed) == 2
-        assert isinstance(mgr.charm.observed[1], ops.CollectStatusEvent)
-        mgr = mgr.charm.observed[0]
-        assert isinstance(mgr, event_kind)
-        assert mgr.relation.id == relation.id
-        assert mgr.app.name == relation.remote_app_name
-        assert mgr.unit.name == "remote/1"
+    evt = _run_and_get(ctx, getattr(ctx.on, event_name)(relation), state_in, event_kind)
+    assert evt.relation.id == relation.id
+    assert evt.app.name == relation.remote_app_name
+    assert evt.unit.name == "remote/1"
 
 
 @pytest.mark.parametrize(
@@ -297,41 +284,35 @@ def test_relation_unit_events_default_unit(event_name, event_kind):
         ("relation_joined", ops.RelationJoinedEvent),
         ("relation_changed", ops.RelationChangedEvent),
     ],
+    ids=["relation_joined", "relation_changed"],
 )
-def test_relation_unit_events(event_name, event_kind):
-    ctx = scenario.Context(ContextCharm, meta=META, actions=ACTIONS)
+def test_relation_unit_events(ctx, event_name, event_kind):
     relation = scenario.Relation(
         "baz", remote_units_data={1: {"x": "y"}, 2: {"x": "z"}}
     )
     state_in = scenario.State(relations=[relation])
     # These look like:
     #   ctx.run(ctx.on.baz_relation_changed(unit=unit_ordinal), state)
-    with ctx(getattr(ctx.on, event_name)(relation, remote_unit=2), state_in) as mgr:
-        mgr.run()
-        assert len(mgr.charm.observed) == 2
-        assert isinstance(mgr.charm.observed[1], ops.CollectStatusEvent)
-        mgr = mgr.charm.observed[0]
-        assert isinstance(mgr, event_kind)
-        assert mgr.relation.id == relation.id
-        assert mgr.app.name == relation.remote_app_name
-        assert mgr.unit.name == "remote/2"
+    evt = _run_and_get(
+        ctx, getattr(ctx.on, event_name)(relation, remote_unit=2), state_in, event_kind
+    )
+    assert evt.relation.id == relation.id
+    assert evt.app.name == relation.remote_app_name
+    assert evt.unit.name == "remote/2"
 
 
-def test_relation_departed_event():
-    ctx = scenario.Context(ContextCharm, meta=META, actions=ACTIONS)
+def test_relation_departed_event(ctx):
     relation = scenario.Relation("baz")
     state_in = scenario.State(relations=[relation])
     # These look like:
     #   ctx.run(ctx.on.baz_relation_departed(unit=unit_ordinal, departing_unit=unit_ordinal), state)
-    with ctx(
-        ctx.on.relation_departed(relation, remote_unit=2, departing_unit=1), state_in
-    ) as mgr:
-        mgr.run()
-        assert len(mgr.charm.observed) == 2
-        assert isinstance(mgr.charm.observed[1], ops.CollectStatusEvent)
-        mgr = mgr.charm.observed[0]
-        assert isinstance(mgr, ops.RelationDepartedEvent)
-        assert mgr.relation.id == relation.id
-        assert mgr.app.name == relation.remote_app_name
-        assert mgr.unit.name == "remote/2"
-        assert mgr.departing_unit.name == "remote/1"
+    evt = _run_and_get(
+        ctx,
+        ctx.on.relation_departed(relation, remote_unit=2, departing_unit=1),
+        state_in,
+        ops.RelationDepartedEvent,
+    )
+    assert evt.relation.id == relation.id
+    assert evt.app.name == relation.remote_app_name
+    assert evt.unit.name == "remote/2"
+    assert evt.departing_unit.name == "remote/1"
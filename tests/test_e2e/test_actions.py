@@ -7,8 +7,8 @@ from scenario import ActionFailed, Context
 from scenario.state import State, _Action, _next_action_id
 
 
-@pytest.fixture(scope="function")
-def mycharm():
+@pytest.fixture(scope="module")
+def mycharm_cls():
     class MyCharm(CharmBase):
         _evt_handler = None
 
@@ -24,6 +24,13 @@ def mycharm():
     return MyCharm
 
 
+@pytest.fixture
+def mycharm(mycharm_cls):
+    yield mycharm_cls
+    # the class is shared by the whole module: don't leak handlers between tests
+    mycharm_cls._evt_handler = None
+
+
 @pytest.mark.parametrize("baz_value", (True, False))
 def test_action_event(mycharm, baz_value):
     ctx = Context(
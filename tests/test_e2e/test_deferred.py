@@ -207,3 +207,42 @@ def test_defer_reemit_relation_event(mycharm):
     ]
     assert len(state_1.deferred) == 1
     assert not state_2.deferred
+
+
+class _Outer:
+    class NestedCharm(CharmBase):
+        META = {"name": "nested"}
+        captured = []
+
+        def __init__(self, framework: Framework):
+            super().__init__(framework)
+            framework.observe(self.on.update_status, self._on_event)
+            framework.observe(self.on.start, self._on_event)
+
+        def _on_event(self, event):
+            self.captured.append(event)
+
+    def handler(self, _):
+        pass
+
+
+def test_deferred_from_bound_method():
+    deferred = _Event("update_status").deferred(handler=_Outer().handler)
+    assert deferred.handle_path == "_Outer/on/update_status[1]"
+    assert deferred.owner == "_Outer"
+    assert deferred.observer == "handler"
+
+
+def test_deferred_from_nested_class_handler():
+    charm = _Outer.NestedCharm
+    charm.captured = []
+    deferred = _Event("update_status").deferred(handler=charm._on_event)
+    assert deferred.owner == "NestedCharm"
+    assert deferred.observer == "_on_event"
+
+    ctx = Context(charm, meta=charm.META)
+    out = ctx.run(ctx.on.start(), State(deferred=[deferred]))
+
+    # the deferred event was routed back to the handler on the nested class
+    assert not out.deferred
+    assert [type(e) for e in charm.captured] == [UpdateStatusEvent, StartEvent]
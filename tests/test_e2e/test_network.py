@@ -14,7 +14,7 @@ from scenario.state import (
 )
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def mycharm():
     class MyCharm(CharmBase):
         _call = None
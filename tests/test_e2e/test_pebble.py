@@ -15,7 +15,7 @@ from scenario.state import CheckInfo, Container, Exec, Mount, Notice, State
 from tests.helpers import jsonpatch_delta, trigger
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def charm_cls():
     class MyCharm(CharmBase):
         def __init__(self, framework: Framework):
@@ -375,25 +375,6 @@ def test_exec_wait_output(charm_cls, command):
         assert ctx.exec_history[container.name][0].command == command
 
 
-def test_exec_wait_output_error(charm_cls):
-    state = State(
-        containers={
-            Container(
-                name="foo",
-                can_connect=True,
-                execs={Exec(["foo"], stdout="hello pebble", return_code=1)},
-            )
-        }
-    )
-
-    ctx = Context(charm_cls, meta={"name": "foo", "containers": {"foo": {}}})
-    with ctx(ctx.on.start(), state) as mgr:
-        container = mgr.charm.unit.get_container("foo")
-        proc = container.exec(["foo"])
-        with pytest.raises(ExecError):
-            proc.wait_output()
-
-
 def test_pebble_custom_notice(charm_cls):
     notices = [
         Notice(key="example.com/foo"),
@@ -17,6 +17,7 @@ from scenario.state import (
     Relation,
     Resource,
     State,
+    Storage,
 )
 from tests.helpers import jsonpatch_delta, sort_patch, trigger
 
@@ -314,9 +315,35 @@ def test_deepcopy_state():
         assert container.name == copied_container.name
 
 
+def test_deepcopy_state_after_lookup():
+    relation = Relation("foo-bar")
+    state = State(relations=[relation])
+    # Populate the cached lookups on both the state and the relation.
+    assert state.get_relations("foo-bar") == (relation,)
+    state_copy = copy.deepcopy(state)
+    assert state_copy == state
+    assert state_copy.get_relations("foo-bar") == (relation,)
+
+
 def test_replace_state():
     containers = [Container("foo"), Container("bar")]
     state = State(containers=containers, leader=True)
     state2 = replace(state, leader=False)
     assert state.leader != state2.leader
     assert state.containers == state2.containers
+
+
+def test_get_storage():
+    foo_0 = Storage("foo", index=0)
+    foo_1 = Storage("foo", index=1)
+    state = State(storages={foo_0, foo_1})
+    assert state.get_storage("foo") is foo_0
+    assert state.get_storage("foo", index=1) is foo_1
+    # A (name, index) pair missing from the index is reported as a ValueError,
+    # whether the name is known or not.
+    with pytest.raises(ValueError, match="name=foo, index=2"):
+        state.get_storage("foo", index=2)
+    with pytest.raises(ValueError, match="name=bar, index=0"):
+        state.get_storage("bar")
+    with pytest.raises(ValueError):
+        State().get_storage("foo")
@@ -16,7 +16,7 @@ from scenario.state import (
 from tests.helpers import trigger
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def mycharm():
     class MyCharm(CharmBase):
         def __init__(self, framework: Framework):
@@ -141,28 +141,25 @@ def test_workload_history(mycharm):
 
 
 @pytest.mark.parametrize(
-    "status",
+    "status_type, ops_status_type, message",
     (
-        ActiveStatus("foo"),
-        WaitingStatus("bar"),
-        BlockedStatus("baz"),
-        MaintenanceStatus("qux"),
-        ErrorStatus("fiz"),
-        UnknownStatus(),
+        (ActiveStatus, ops.ActiveStatus, "foo"),
+        (WaitingStatus, ops.WaitingStatus, "bar"),
+        (BlockedStatus, ops.BlockedStatus, "baz"),
+        (MaintenanceStatus, ops.MaintenanceStatus, "qux"),
+        (ErrorStatus, ops.ErrorStatus, "fiz"),
+        (UnknownStatus, ops.UnknownStatus, None),
     ),
+    ids=("active", "waiting", "blocked", "maintenance", "error", "unknown"),
 )
-def test_status_comparison(status):
-    if isinstance(status, UnknownStatus):
-        ops_status = ops.UnknownStatus()
-    else:
-        ops_status = getattr(ops, status.__class__.__name__)(status.message)
+def test_status_comparison(status_type, ops_status_type, message):
+    args = () if message is None else (message,)
+    status = status_type(*args)
+    ops_status = ops_status_type(*args)
     # A status can be compared to itself.
     assert status == status
     # A status can be compared to another instance of the scenario class.
-    if isinstance(status, UnknownStatus):
-        assert status == status.__class__()
-    else:
-        assert status == status.__class__(status.message)
+    assert status == status_type(*args)
     # A status can be compared to an instance of the ops class.
     assert status == ops_status
     # isinstance also works for comparing to the ops classes.